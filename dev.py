@@ -6,41 +6,148 @@ Contributors: Pascal CESCATO (@pcescato)
 """
 
 import requests
+import numpy as np
+import orjson
 import argparse
-import json
 import csv
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, NamedTuple
+
+# Reading time buckets: labels, and the inclusive upper bound in minutes of every bucket but the last
+_READING_TIME_LABELS = ('0-3 min', '4-5 min', '6-10 min', '11-15 min', '16+ min')
+_READING_TIME_EDGES = (3, 5, 10, 15)
+
+# top_articles sort criteria -> precomputed DevToAnalytics column holding the sort key
+_SORT_COLUMNS = {
+    'views': '_views',
+    'reactions': '_reactions',
+    'comments': '_comments',
+    'engagement': '_engagement'
+}
+
+# Per-article report blocks, formatted in one go and written with a single print per section
+_TOP_ARTICLE_TMPL = (
+    "\n{i}. {title}\n"
+    "   👀 Views: {views} | ❤️  Reactions: {reactions} | 💬 Comments: {comments} | 🎯 Engagement: {engagement:.2f}%\n"
+    "   🔗 {url}\n"
+    "   📅 Published: {published}"
+)
+_UNDERPERFORMER_TMPL = (
+    "📉 {title}\n"
+    "   Views: {views} (avg: {avg_views:.0f}) | Engagement: {engagement:.2f}% (avg: {avg_engagement:.2f}%)\n"
+    "   🔗 {url}\n"
+)
+
+# DEV.to API pagination: largest page size it accepts, and how many pages to request at once
+PER_PAGE = 1000
+MAX_FETCH_WORKERS = 8
+
+# Last response body and ETag of every fetched page, revalidated with If-None-Match.
+# One owner-only file per API key, since pages include unpublished drafts.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'devto-analytics-pro')
+
+
+class _Aggregate(NamedTuple):
+    """Totals and averages over the articles selected by a date filter"""
+    idx: np.ndarray
+    count: int
+    total_views: int
+    total_reactions: int
+    total_comments: int
+    avg_views: float
+    avg_engagement: float
+
 
 class DevToAnalytics:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://dev.to/api"
         self.headers = {"api-key": api_key}
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self.articles = []
+        self._page_cache = {}
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self.cache_file = os.path.join(CACHE_DIR, f"articles-{key_hash}.json")
+        self._precompute_metrics()
+
+    def _load_cache(self) -> Dict:
+        """Load cached pages, treating a missing or corrupt cache as empty"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _save_cache(self):
+        """Atomically replace the cache file; failures only cost a re-download"""
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(self._page_cache))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    def _fetch_page(self, page: int) -> List[Dict]:
+        """Fetch one page of articles, exiting on API errors"""
+        cached = self._page_cache.get(str(page))
+        response = self.session.get(
+            f"{self.base_url}/articles/me/all",
+            params={'page': page, 'per_page': PER_PAGE},
+            headers={'If-None-Match': cached['etag']} if cached else None,
+            timeout=10
+        )
+
+        if response.status_code == 304 and cached:
+            return cached['body']
+        elif response.status_code == 200:
+            body = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._page_cache[str(page)] = {'etag': etag, 'body': body}
+            return body
+        elif response.status_code == 401:
+            print(f"❌ Error: Invalid API key (401 Unauthorized)")
+            print(f"Please check your API key at https://dev.to/settings/extensions")
+            exit(1)
+        else:
+            print(f"❌ Error: {response.status_code}")
+            print(f"Response: {response.text}")
+            exit(1)
 
     def fetch_articles(self):
         """Fetch all published articles"""
         print("🔄 Fetching your Dev.to articles...")
+        self._page_cache = self._load_cache()
         try:
-            response = requests.get(
-                f"{self.base_url}/articles/me/all",
-                headers=self.headers,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                self.articles = response.json()
-                print(f"✅ Loaded {len(self.articles)} articles\n")
-            elif response.status_code == 401:
-                print(f"❌ Error: Invalid API key (401 Unauthorized)")
-                print(f"Please check your API key at https://dev.to/settings/extensions")
-                exit(1)
-            else:
-                print(f"❌ Error: {response.status_code}")
-                print(f"Response: {response.text}")
-                exit(1)
+            # Copy the first page: cached page bodies must not grow with later pages
+            articles = list(self._fetch_page(1))
+
+            # Only accounts with more than one full page pay for the thread pool
+            if len(articles) == PER_PAGE:
+                with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+                    next_page = 2
+                    last_page_full = True
+                    while last_page_full:
+                        pages = range(next_page, next_page + MAX_FETCH_WORKERS)
+                        for chunk in pool.map(self._fetch_page, pages):
+                            articles.extend(chunk)
+                            if len(chunk) < PER_PAGE:
+                                last_page_full = False
+                                break
+                        next_page += MAX_FETCH_WORKERS
+
+            self._save_cache()
+            self.articles = articles
+            self._precompute_metrics()
+            print(f"✅ Loaded {len(self.articles)} articles\n")
         except requests.exceptions.Timeout:
             print("❌ Error: Request timed out. Please check your internet connection.")
             exit(1)
@@ -49,25 +156,87 @@ class DevToAnalytics:
             print(f"Details: {str(e)}")
             exit(1)
 
-    def filter_by_date(self, days: int = None):
-        """Filter articles by date range"""
-        if not days:
-            return self.articles
-
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        filtered = []
-
+    def _precompute_metrics(self):
+        """Compute per-article derived metrics once so analyses can reuse them"""
+        self._aggregates = {}
+
+        # Columnar copies of the numeric fields for vectorized aggregation. Views,
+        # reactions and comments share one (3, N) matrix so they reduce together.
+        count = len(self.articles)
+        self._counts = np.array(
+            [(a.get('page_views_count', 0), a.get('public_reactions_count', 0), a.get('comments_count', 0))
+             for a in self.articles],
+            dtype=np.int64).reshape(count, 3).T.copy()
+        self._views, self._reactions, self._comments = self._counts
+        # Same formula as calculate_engagement_rate, applied to every article in one ufunc pass
+        self._engagement = np.divide(
+            self._reactions + self._comments, self._views,
+            out=np.zeros(count), where=self._views != 0) * 100
+        # Publish dates parsed once; NaN for unpublished articles never passes a cutoff
+        self._pub_epoch = np.fromiter(
+            (datetime.fromisoformat(a['published_at'].replace('Z', '+00:00')).timestamp()
+             if a.get('published_at') else np.nan
+             for a in self.articles),
+            dtype=np.float64, count=count)
+
+        # Tags flattened into parallel arrays: entry j is tag _tag_names[_tag_ids[j]]
+        # on article _tag_owner[j], so per-tag totals reduce to np.bincount. Tag strings
+        # are interned so repeats across articles share one object and hash lookups hit by identity.
+        intern = sys.intern
+        tag_vocab = {}
+        tag_ids = []
+        tag_counts = []
         for article in self.articles:
-            if not article.get('published_at'):
-                continue
-            # Parse published date and make timezone-aware
-            pub_date_str = article['published_at'].replace('Z', '+00:00')
-            pub_date = datetime.fromisoformat(pub_date_str)
+            tags = article.get('tag_list') or []
+            if tags:
+                tags = article['tag_list'] = [intern(tag) for tag in tags]
+            tag_ids.extend(tag_vocab.setdefault(tag, len(tag_vocab)) for tag in tags)
+            tag_counts.append(len(tags))
+        self._tag_names = list(tag_vocab)
+        self._tag_ids = np.array(tag_ids, dtype=np.int32)
+        self._tag_owner = np.repeat(np.arange(count), tag_counts)
+
+        self._reading_bucket = np.searchsorted(
+            _READING_TIME_EDGES,
+            np.fromiter((a.get('reading_time_minutes', 0) for a in self.articles), dtype=np.int64, count=count))
+
+        # Display strings used by the CSV export
+        self._pub_date_str = [
+            a['published_at'][:10] if a.get('published_at') else "Unpublished" for a in self.articles
+        ]
+        self._tag_str = [', '.join(a.get('tag_list') or []) for a in self.articles]
+
+    def _select(self, idx) -> List[Dict]:
+        """Return the articles at the indices produced by filter_by_date"""
+        articles = self.articles
+        return [articles[i] for i in idx]
+
+    def _aggregate(self, days: int = None) -> _Aggregate:
+        """Return totals and averages for a date filter, computed once per filter"""
+        key = days or 0
+        agg = self._aggregates.get(key)
+        if agg is None:
+            idx = self.filter_by_date(days)
+            count = len(idx)
+            total_views, total_reactions, total_comments = self._counts[:, idx].sum(axis=1).tolist()
+            agg = self._aggregates[key] = _Aggregate(
+                idx=idx,
+                count=count,
+                total_views=total_views,
+                total_reactions=total_reactions,
+                total_comments=total_comments,
+                avg_views=total_views / count if count else 0.0,
+                avg_engagement=float(self._engagement[idx].mean()) if count else 0.0
+            )
+        return agg
 
-            if pub_date >= cutoff:
-                filtered.append(article)
+    def filter_by_date(self, days: int = None):
+        """Return indices of articles published in the last N days"""
+        if not days:
+            return np.arange(len(self.articles))
 
-        return filtered
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+        return np.flatnonzero(self._pub_epoch >= cutoff)
 
     def calculate_engagement_rate(self, article: Dict) -> float:
         """Calculate engagement rate (reactions + comments) / views * 100"""
@@ -80,154 +249,142 @@ class DevToAnalytics:
 
     def overview(self, days: int = None):
         """Display overview statistics"""
-        articles = self.filter_by_date(days)
+        agg = self._aggregate(days)
 
-        if not articles:
+        if not agg.count:
             print("❌ No articles found in this time period")
             return
 
-        total_views = sum(a.get('page_views_count', 0) for a in articles)
-        total_reactions = sum(a.get('public_reactions_count', 0) for a in articles)
-        total_comments = sum(a.get('comments_count', 0) for a in articles)
-        avg_views = total_views / len(articles) if len(articles) > 0 else 0
-
-        # Calculate average engagement rate
-        total_engagement = sum(self.calculate_engagement_rate(a) for a in articles)
-        avg_engagement = total_engagement / len(articles) if len(articles) > 0 else 0
-
         time_period = f"last {days} days" if days else "all time"
 
         print(f"\n{'='*60}")
         print(f"📊 DEV.TO ANALYTICS OVERVIEW ({time_period})")
         print(f"{'='*60}")
-        print(f"📝 Total Articles:      {len(articles)}")
-        print(f"👀 Total Views:         {total_views:,}")
-        print(f"❤️  Total Reactions:     {total_reactions}")
-        print(f"💬 Total Comments:      {total_comments}")
-        print(f"📈 Avg Views/Article:   {avg_views:.0f}")
-        print(f"🎯 Engagement Rate:     {avg_engagement:.2f}%")
+        print(f"📝 Total Articles:      {agg.count}")
+        print(f"👀 Total Views:         {agg.total_views:,}")
+        print(f"❤️  Total Reactions:     {agg.total_reactions}")
+        print(f"💬 Total Comments:      {agg.total_comments}")
+        print(f"📈 Avg Views/Article:   {agg.avg_views:.0f}")
+        print(f"🎯 Engagement Rate:     {agg.avg_engagement:.2f}%")
         print(f"{'='*60}\n")
 
     def top_articles(self, n: int = 10, sort_by: str = 'views', days: int = None):
         """Show top N articles"""
-        articles = self.filter_by_date(days)
+        if n < 1:
+            print("❌ Number of top articles must be at least 1")
+            return
+
+        idx = self.filter_by_date(days)
 
-        if not articles:
+        if not len(idx):
             print("❌ No articles found in this time period")
             return
 
-        sort_key = {
-            'views': lambda a: a.get('page_views_count', 0),
-            'reactions': lambda a: a.get('public_reactions_count', 0),
-            'comments': lambda a: a.get('comments_count', 0),
-            'engagement': lambda a: self.calculate_engagement_rate(a)
-        }
-
-        sorted_articles = sorted(articles, key=sort_key[sort_by], reverse=True)[:n]
+        key_arr = getattr(self, _SORT_COLUMNS[sort_by])[idx]
+
+        # Find the Nth largest key in O(A); everything above it is in, and ties at the
+        # cutoff are filled in article order, matching a stable sort
+        if n < len(idx):
+            cutoff = np.partition(key_arr, len(key_arr) - n)[len(key_arr) - n]
+            above = np.flatnonzero(key_arr > cutoff)
+            tied = np.flatnonzero(key_arr == cutoff)[:n - len(above)]
+            top = np.sort(np.concatenate((above, tied)))
+        else:
+            top = np.arange(len(idx))
+        top = top[np.argsort(-key_arr[top], kind='stable')]
+        top_idx = idx[top]
+        sorted_articles = self._select(top_idx)
+        top_engagement = self._engagement[top_idx].tolist()
 
         print(f"\n🏆 TOP {n} ARTICLES (by {sort_by})")
         print("="*100)
 
-        for i, article in enumerate(sorted_articles, 1):
-            title = article['title'][:70]
-            views = article.get('page_views_count', 0)
-            reactions = article.get('public_reactions_count', 0)
-            comments = article.get('comments_count', 0)
-            engagement = self.calculate_engagement_rate(article)
-            url = article['url']
-            published = article['published_at'][:10] if article['published_at'] else "Unpublished"
-
-            print(f"\n{i}. {title}")
-            print(f"   👀 Views: {views} | ❤️  Reactions: {reactions} | 💬 Comments: {comments} | 🎯 Engagement: {engagement:.2f}%")
-            print(f"   🔗 {url}")
-            print(f"   📅 Published: {published}")
+        print('\n'.join(
+            _TOP_ARTICLE_TMPL.format(
+                i=i,
+                title=article['title'][:70],
+                views=article.get('page_views_count', 0),
+                reactions=article.get('public_reactions_count', 0),
+                comments=article.get('comments_count', 0),
+                engagement=engagement,
+                url=article['url'],
+                published=article['published_at'][:10] if article['published_at'] else "Unpublished"
+            )
+            for i, (article, engagement) in enumerate(zip(sorted_articles, top_engagement), 1)
+        ))
 
     def tag_analysis(self, days: int = None):
         """Analyze performance by tags"""
-        articles = self.filter_by_date(days)
+        idx = self.filter_by_date(days)
         
-        if not articles:
+        if not len(idx):
             print("❌ No articles found in this time period")
             return
-            
-        tag_stats = defaultdict(lambda: {
-            'count': 0,
-            'views': 0,
-            'reactions': 0,
-            'comments': 0
-        })
-
-        for article in articles:
-            tags = article.get('tag_list', [])
-            views = article.get('page_views_count', 0)
-            reactions = article.get('public_reactions_count', 0)
-            comments = article.get('comments_count', 0)
-
-            for tag in tags:
-                tag_stats[tag]['count'] += 1
-                tag_stats[tag]['views'] += views
-                tag_stats[tag]['reactions'] += reactions
-                tag_stats[tag]['comments'] += comments
-
-        if not tag_stats:
+
+        # Keep only the tag entries belonging to the selected articles
+        selected = np.zeros(len(self.articles), dtype=bool)
+        selected[idx] = True
+        entries = selected[self._tag_owner]
+        tag_ids = self._tag_ids[entries]
+        owners = self._tag_owner[entries]
+
+        n_tags = len(self._tag_names)
+        tag_count = np.bincount(tag_ids, minlength=n_tags)
+        tag_views = np.bincount(tag_ids, weights=self._views[owners], minlength=n_tags).astype(np.int64)
+        tag_reactions = np.bincount(tag_ids, weights=self._reactions[owners], minlength=n_tags).astype(np.int64)
+        tag_comments = np.bincount(tag_ids, weights=self._comments[owners], minlength=n_tags).astype(np.int64)
+
+        present = np.flatnonzero(tag_count)
+        if not len(present):
             print("❌ No tags found in articles")
             return
 
-        # Sort by total views
-        sorted_tags = sorted(
-            tag_stats.items(),
-            key=lambda x: x[1]['views'],
-            reverse=True
-        )
+        # Sort by total views; ties keep the order tags first appear in the selected articles
+        first_seen = np.full(n_tags, len(tag_ids))
+        np.minimum.at(first_seen, tag_ids, np.arange(len(tag_ids)))
+        sorted_tags = present[np.lexsort((first_seen[present], -tag_views[present]))]
 
         print(f"\n🏷️  TAG PERFORMANCE ANALYSIS")
         print("="*100)
         print(f"{'Tag':<20} {'Articles':<10} {'Total Views':<15} {'Avg Views':<12} {'Reactions':<12} {'Comments'}")
         print("-"*100)
 
-        for tag, stats in sorted_tags:
-            avg_views = stats['views'] / stats['count'] if stats['count'] > 0 else 0
-            print(f"{tag:<20} {stats['count']:<10} {stats['views']:<15} {avg_views:<12.0f} {stats['reactions']:<12} {stats['comments']}")
+        for t in sorted_tags:
+            tag = self._tag_names[t]
+            count = int(tag_count[t])
+            views = int(tag_views[t])
+            avg_views = views / count
+            print(f"{tag:<20} {count:<10} {views:<15} {avg_views:<12.0f} {int(tag_reactions[t]):<12} {int(tag_comments[t])}")
 
     def reading_time_analysis(self, days: int = None):
         """Analyze performance by reading time"""
-        articles = self.filter_by_date(days)
+        idx = self.filter_by_date(days)
 
-        if not articles:
+        if not len(idx):
             print("❌ No articles found in this time period")
             return
 
         # Group by reading time ranges
-        time_ranges = {
-            '0-3 min': {'articles': [], 'range': (0, 3)},
-            '4-5 min': {'articles': [], 'range': (4, 5)},
-            '6-10 min': {'articles': [], 'range': (6, 10)},
-            '11-15 min': {'articles': [], 'range': (11, 15)},
-            '16+ min': {'articles': [], 'range': (16, 999)}
-        }
-
-        for article in articles:
-            reading_time = article.get('reading_time_minutes', 0)
-            for range_name, range_data in time_ranges.items():
-                min_time, max_time = range_data['range']
-                if min_time <= reading_time <= max_time:
-                    range_data['articles'].append(article)
-                    break
+        buckets = self._reading_bucket[idx]
+        n_buckets = len(_READING_TIME_LABELS)
+        bucket_count = np.bincount(buckets, minlength=n_buckets)
+        bucket_views = np.bincount(buckets, weights=self._views[idx], minlength=n_buckets)
+        bucket_reactions = np.bincount(buckets, weights=self._reactions[idx], minlength=n_buckets)
 
         print(f"\n📚 READING TIME ANALYSIS")
         print("="*80)
         print(f"{'Time Range':<15} {'Articles':<10} {'Avg Views':<15} {'Avg Reactions'}")
         print("-"*80)
 
-        for range_name, range_data in time_ranges.items():
-            articles_in_range = range_data['articles']
-            if not articles_in_range:
+        for b, range_name in enumerate(_READING_TIME_LABELS):
+            count = int(bucket_count[b])
+            if not count:
                 continue
 
-            avg_views = sum(a.get('page_views_count', 0) for a in articles_in_range) / len(articles_in_range)
-            avg_reactions = sum(a.get('public_reactions_count', 0) for a in articles_in_range) / len(articles_in_range)
+            avg_views = bucket_views[b] / count
+            avg_reactions = bucket_reactions[b] / count
 
-            print(f"{range_name:<15} {len(articles_in_range):<10} {avg_views:<15.0f} {avg_reactions:.1f}")
+            print(f"{range_name:<15} {count:<10} {avg_views:<15.0f} {avg_reactions:.1f}")
 
     def growth_trends(self):
         """Show growth trends by month"""
@@ -235,59 +392,48 @@ class DevToAnalytics:
             print("❌ No articles found")
             return
             
-        monthly_stats = defaultdict(lambda: {
-            'articles': 0,
-            'views': 0,
-            'reactions': 0,
-            'comments': 0
-        })
+        published = np.flatnonzero(~np.isnan(self._pub_epoch))
 
-        for article in self.articles:
-            if not article.get('published_at'):
-                continue
-            pub_date = datetime.fromisoformat(article['published_at'].replace('Z', '+00:00'))
-            month_key = pub_date.strftime('%Y-%m')
-
-            monthly_stats[month_key]['articles'] += 1
-            monthly_stats[month_key]['views'] += article.get('page_views_count', 0)
-            monthly_stats[month_key]['reactions'] += article.get('public_reactions_count', 0)
-            monthly_stats[month_key]['comments'] += article.get('comments_count', 0)
-
-        if not monthly_stats:
+        if not len(published):
             print("❌ No published articles with dates found")
             return
 
-        sorted_months = sorted(monthly_stats.items())
+        # Group by calendar month (UTC); np.unique returns the months sorted
+        months = self._pub_epoch[published].astype(np.int64).astype('datetime64[s]').astype('datetime64[M]')
+        unique_months, month_idx = np.unique(months, return_inverse=True)
+        month_articles = np.bincount(month_idx)
+        month_views = np.bincount(month_idx, weights=self._views[published]).astype(np.int64)
+        month_reactions = np.bincount(month_idx, weights=self._reactions[published]).astype(np.int64)
 
         print(f"\n📈 GROWTH TREND (Last 12 Months)")
         print("="*80)
         print(f"{'Month':<15} {'Articles':<10} {'Total Views':<15} {'Total Reactions'}")
         print("-"*80)
 
-        for month, stats in sorted_months[-12:]:
-            print(f"{month:<15} {stats['articles']:<10} {stats['views']:<15} {stats['reactions']}")
+        for m in range(max(len(unique_months) - 12, 0), len(unique_months)):
+            month = str(unique_months[m])
+            print(f"{month:<15} {month_articles[m]:<10} {month_views[m]:<15} {month_reactions[m]}")
 
     def underperformers(self, days: int = 30):
         """Find underperforming articles - articles that are BOTH low views AND low engagement"""
-        articles = self.filter_by_date(days)
+        agg = self._aggregate(days)
 
-        if not articles:
+        if not agg.count:
             print(f"❌ No articles published in the last {days} days")
             return
 
-        if len(articles) < 2:
+        if agg.count < 2:
             print(f"ℹ️  Need at least 2 articles to identify underperformers")
             return
 
-        avg_views = sum(a.get('page_views_count', 0) for a in articles) / len(articles)
-        avg_engagement = sum(self.calculate_engagement_rate(a) for a in articles) / len(articles)
+        idx = agg.idx
+        avg_views = agg.avg_views
+        avg_engagement = agg.avg_engagement
 
         # FIXED: Changed OR to AND - article must be low on BOTH metrics to be considered underperforming
-        underperformers = [
-            a for a in articles
-            if a.get('page_views_count', 0) < avg_views * 0.5
-            and self.calculate_engagement_rate(a) < avg_engagement * 0.5
-        ]
+        low = (self._views[idx] < avg_views * 0.5) & (self._engagement[idx] < avg_engagement * 0.5)
+        low_idx = idx[low]
+        underperformers = self._select(low_idx)
 
         if not underperformers:
             print(f"\n✅ No significantly underperforming articles in the last {days} days!")
@@ -297,35 +443,56 @@ class DevToAnalytics:
         print("="*100)
         print(f"Articles with <50% of average views ({avg_views:.0f}) AND <50% of average engagement ({avg_engagement:.2f}%)\n")
 
-        for article in underperformers:
-            title = article['title'][:70]
-            views = article.get('page_views_count', 0)
-            engagement = self.calculate_engagement_rate(article)
-
-            print(f"📉 {title}")
-            print(f"   Views: {views} (avg: {avg_views:.0f}) | Engagement: {engagement:.2f}% (avg: {avg_engagement:.2f}%)")
-            print(f"   🔗 {article['url']}\n")
+        print('\n'.join(
+            _UNDERPERFORMER_TMPL.format(
+                title=article['title'][:70],
+                views=article.get('page_views_count', 0),
+                avg_views=avg_views,
+                engagement=engagement,
+                avg_engagement=avg_engagement,
+                url=article['url']
+            )
+            for article, engagement in zip(underperformers, self._engagement[low_idx].tolist())
+        ))
 
     def export_json(self, filename: str, days: int = None):
         """Export data to JSON"""
-        articles = self.filter_by_date(days)
+        agg = self._aggregate(days)
 
         export_data = {
             'exported_at': datetime.now(timezone.utc).isoformat(),
-            'total_articles': len(articles),
-            'total_views': sum(a.get('page_views_count', 0) for a in articles),
-            'total_reactions': sum(a.get('public_reactions_count', 0) for a in articles),
-            'articles': articles
+            'total_articles': agg.count,
+            'total_views': agg.total_views,
+            'total_reactions': agg.total_reactions,
+            'articles': self._select(agg.idx)
         }
 
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
         print(f"✅ Data exported to {filename}")
 
     def export_csv(self, filename: str, days: int = None):
         """Export data to CSV"""
-        articles = self.filter_by_date(days)
+        idx = self.filter_by_date(days)
+        pub_dates = self._pub_date_str
+        tags = self._tag_str
+        engagement = self._engagement
+
+        rows = [
+            (
+                article['title'],
+                article['url'],
+                pub_dates[i],
+                article.get('page_views_count', 0),
+                article.get('public_reactions_count', 0),
+                article.get('comments_count', 0),
+                f"{engagement[i]:.2f}",
+                article.get('reading_time_minutes', 0),
+                tags[i]
+            )
+            for i, article in zip(idx.tolist(), self._select(idx))
+        ]
 
         with open(filename, 'w', newline='') as f:
             writer = csv.writer(f)
@@ -333,19 +500,7 @@ class DevToAnalytics:
                 'Title', 'URL', 'Published', 'Views', 'Reactions',
                 'Comments', 'Engagement %', 'Reading Time', 'Tags'
             ])
-
-            for article in articles:
-                writer.writerow([
-                    article['title'],
-                    article['url'],
-                    article['published_at'][:10] if article['published_at'] else "Unpublished",
-                    article.get('page_views_count', 0),
-                    article.get('public_reactions_count', 0),
-                    article.get('comments_count', 0),
-                    f"{self.calculate_engagement_rate(article):.2f}",
-                    article.get('reading_time_minutes', 0),
-                    ', '.join(article.get('tag_list', []))
-                ])
+            writer.writerows(rows)
 
         print(f"✅ Data exported to {filename}")
 
@@ -10,6 +10,8 @@ Date: 2025-10-28
 import pytest
 import sys
 import os
+import json
+from datetime import datetime, timedelta, timezone
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -51,6 +53,219 @@ class TestDev:
     #     assert result is not None
 
 
+def make_analytics(articles):
+    """Build an analytics instance from in-memory articles (no network)"""
+    import dev
+    analytics = dev.DevToAnalytics("test-key")
+    analytics.articles = articles
+    analytics._precompute_metrics()
+    return analytics
+
+
+def sample_articles():
+    """A small, deterministic set of articles shaped like the DEV.to API"""
+    now = datetime.now(timezone.utc)
+
+    def published(days_ago):
+        return (now - timedelta(days=days_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    return [
+        {'id': 1, 'title': 'Python tips', 'url': 'https://dev.to/a/1',
+         'published_at': published(5), 'page_views_count': 1000,
+         'public_reactions_count': 40, 'comments_count': 10,
+         'reading_time_minutes': 4, 'tag_list': ['python', 'beginners']},
+        {'id': 2, 'title': 'Rust intro', 'url': 'https://dev.to/a/2',
+         'published_at': published(60), 'page_views_count': 200,
+         'public_reactions_count': 30, 'comments_count': 10,
+         'reading_time_minutes': 12, 'tag_list': ['rust']},
+        {'id': 3, 'title': 'Quiet post', 'url': 'https://dev.to/a/3',
+         'published_at': published(10), 'page_views_count': 10,
+         'public_reactions_count': 0, 'comments_count': 0,
+         'reading_time_minutes': 2, 'tag_list': ['python']},
+        {'id': 4, 'title': 'Draft', 'url': 'https://dev.to/a/4',
+         'published_at': None, 'page_views_count': 0,
+         'public_reactions_count': 0, 'comments_count': 0,
+         'reading_time_minutes': 1, 'tag_list': []},
+    ]
+
+
+class TestAnalytics:
+    """Functional tests against in-memory article data"""
+
+    def test_precomputed_engagement(self):
+        analytics = make_analytics(sample_articles())
+        assert analytics._engagement.tolist() == pytest.approx([5.0, 20.0, 0.0, 0.0])
+
+    def test_top_articles_by_engagement(self, capsys):
+        analytics = make_analytics(sample_articles())
+        analytics.top_articles(2, 'engagement')
+        out = capsys.readouterr().out
+        assert out.index('Rust intro') < out.index('Python tips')
+        assert 'Quiet post' not in out
+
+    def test_top_articles_ties_at_cutoff_keep_article_order(self, capsys):
+        articles = [
+            {'id': i, 'title': f'T{i}', 'url': f'u{i}', 'published_at': None,
+             'page_views_count': 9 if i == 20 else 5}
+            for i in range(21)
+        ]
+        analytics = make_analytics(articles)
+        analytics.top_articles(3)
+        titles = [line.split('. ', 1)[1] for line in capsys.readouterr().out.splitlines()
+                  if line[:1].isdigit()]
+        assert titles == ['T20', 'T0', 'T1']
+
+    def test_top_articles_rejects_non_positive_n(self, capsys):
+        analytics = make_analytics(sample_articles())
+        analytics.top_articles(-40)
+        assert 'must be at least 1' in capsys.readouterr().out
+
+    def test_filter_by_date_excludes_old_and_unpublished(self):
+        analytics = make_analytics(sample_articles())
+        assert analytics.filter_by_date(30).tolist() == [0, 2]
+        assert analytics.filter_by_date().tolist() == [0, 1, 2, 3]
+
+    def test_overview_totals(self, capsys):
+        analytics = make_analytics(sample_articles())
+        analytics.overview(30)
+        out = capsys.readouterr().out
+        assert "Total Articles:      2" in out
+        assert "Total Views:         1,010" in out
+        assert "Engagement Rate:     2.50%" in out
+
+    def test_aggregate_is_reused_until_refetch(self):
+        analytics = make_analytics(sample_articles())
+        agg = analytics._aggregate(30)
+        assert (agg.count, agg.total_views, agg.total_comments) == (2, 1010, 10)
+        assert analytics._aggregate(30) is agg
+        analytics._precompute_metrics()
+        assert analytics._aggregate(30) is not agg
+
+    def test_underperformers_need_low_views_and_engagement(self, capsys):
+        analytics = make_analytics(sample_articles())
+        analytics.underperformers(30)
+        out = capsys.readouterr().out
+        assert 'Quiet post' in out
+        assert 'Python tips' not in out
+
+    def test_tag_analysis_totals(self, capsys):
+        articles = sample_articles()
+        # 'rust' appears first overall, but 'go' appears first within the last 30 days
+        articles.append(dict(articles[2], id=5, title='Tied tags', page_views_count=5, tag_list=['go', 'rust']))
+        analytics = make_analytics(articles)
+        analytics.tag_analysis(30)
+        rows = [line.split() for line in capsys.readouterr().out.splitlines()]
+        tag_rows = [r for r in rows if r and r[0] in ('python', 'beginners', 'rust', 'go')]
+        assert tag_rows == [
+            ['python', '2', '1010', '505', '40', '10'],
+            ['beginners', '1', '1000', '1000', '40', '10'],
+            ['go', '1', '5', '5', '0', '0'],
+            ['rust', '1', '5', '5', '0', '0'],
+        ]
+
+    def test_fetch_articles_paginates_until_short_page(self, monkeypatch, tmp_path, capsys):
+        import dev
+        monkeypatch.setattr(dev, 'PER_PAGE', 2)
+        monkeypatch.setattr(dev, 'CACHE_DIR', str(tmp_path))
+        articles = sample_articles()
+        analytics = dev.DevToAnalytics("test-key")
+        requested = []
+
+        def fake_fetch_page(page):
+            requested.append(page)
+            return articles[(page - 1) * 2:page * 2]
+
+        monkeypatch.setattr(analytics, '_fetch_page', fake_fetch_page)
+        articles.append(dict(articles[0], id=5))
+        analytics.fetch_articles()
+        assert [a['id'] for a in analytics.articles] == [1, 2, 3, 4, 5]
+        assert {1, 2, 3} <= set(requested)
+
+    def test_fetch_articles_revalidates_cached_pages(self, monkeypatch, tmp_path, capsys):
+        import dev
+        cache_dir = tmp_path / 'cache'
+        monkeypatch.setattr(dev, 'CACHE_DIR', str(cache_dir))
+        articles = sample_articles()[:1]
+        sent_etags = []
+
+        class FakeResponse:
+            def __init__(self, status_code, body=None):
+                self.status_code = status_code
+                self.headers = {'ETag': 'W/"v1"'}
+                self.content = json.dumps(body).encode() if body is not None else b''
+
+        def fake_get(url, params=None, headers=None, timeout=None):
+            etag = (headers or {}).get('If-None-Match')
+            sent_etags.append(etag)
+            return FakeResponse(304) if etag == 'W/"v1"' else FakeResponse(200, articles)
+
+        for _ in range(2):
+            analytics = dev.DevToAnalytics("test-key")
+            monkeypatch.setattr(analytics.session, 'get', fake_get)
+            analytics.fetch_articles()
+            assert [a['title'] for a in analytics.articles] == ['Python tips']
+
+        assert sent_etags == [None, 'W/"v1"']
+        cache_files = list(cache_dir.iterdir())
+        assert len(cache_files) == 1
+        assert cache_files[0].stat().st_mode & 0o777 == 0o600
+
+        # Another account never revalidates against this account's pages
+        other = dev.DevToAnalytics("other-key")
+        monkeypatch.setattr(other.session, 'get', fake_get)
+        other.fetch_articles()
+        assert sent_etags[-1] is None
+
+    def test_growth_trends_groups_by_month(self, capsys):
+        articles = sample_articles()
+        analytics = make_analytics(articles)
+        analytics.growth_trends()
+        out = capsys.readouterr().out
+
+        expected = {}
+        for a in articles:
+            if a['published_at']:
+                month = a['published_at'][:7]
+                count, views = expected.get(month, (0, 0))
+                expected[month] = (count + 1, views + a['page_views_count'])
+        rows = {r[0]: (int(r[1]), int(r[2])) for r in (line.split() for line in out.splitlines())
+                if len(r) == 4 and r[0][:4].isdigit()}
+        assert rows == expected
+
+    def test_reading_time_buckets(self, capsys):
+        analytics = make_analytics(sample_articles())
+        analytics.reading_time_analysis()
+        rows = [line.split() for line in capsys.readouterr().out.splitlines()]
+        bucket_rows = [r for r in rows if len(r) == 5 and r[1] == 'min']
+        assert bucket_rows == [
+            ['0-3', 'min', '2', '5', '0.0'],
+            ['4-5', 'min', '1', '1000', '40.0'],
+            ['11-15', 'min', '1', '200', '30.0'],
+        ]
+
+    def test_export_json_keeps_api_article_fields(self, tmp_path, capsys):
+        articles = sample_articles()
+        api_keys = [sorted(a) for a in articles]
+        analytics = make_analytics(articles)
+        path = tmp_path / 'out.json'
+        analytics.export_json(str(path))
+        with open(path) as f:
+            exported = json.load(f)
+        assert exported['total_articles'] == 4
+        assert [sorted(a) for a in exported['articles']] == api_keys
+
+    def test_export_csv_rows(self, tmp_path, capsys):
+        import csv
+        analytics = make_analytics(sample_articles())
+        path = tmp_path / 'out.csv'
+        analytics.export_csv(str(path))
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 5
+        assert rows[1][3:] == ['1000', '40', '10', '5.00', '4', 'python, beginners']
+        assert rows[4][2] == 'Unpublished'
+
+
 # Integration Tests
 class TestIntegration:
     """Integration tests for the tool"""